@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, Callable, Optional
 
 if TYPE_CHECKING:
     from tools.models import ToolModelCategory
+    from utils.model_restrictions import ModelRestrictionService
 
 from .shared import ModelCapabilities, ModelResponse, ProviderType
 
@@ -117,11 +118,7 @@ class ModelProvider(ABC):
         if not model_configs:
             return []
 
-        restriction_service = None
-        if respect_restrictions:
-            from utils.model_restrictions import get_restriction_service
-
-            restriction_service = get_restriction_service()
+        restriction_service = self._get_restriction_service() if respect_restrictions else None
 
         if restriction_service:
             allowed_configs = {}
@@ -370,12 +367,7 @@ class ModelProvider(ABC):
     ) -> None:
         """Raise ``ValueError`` if the model violates restriction policy."""
 
-        try:
-            from utils.model_restrictions import get_restriction_service
-        except Exception:  # pragma: no cover - only triggered if service import breaks
-            return
-
-        restriction_service = get_restriction_service()
+        restriction_service = self._get_restriction_service()
         if not restriction_service:
             return
 
@@ -386,6 +378,16 @@ class ModelProvider(ABC):
             f"{self.get_provider_type().value} model '{canonical_name}' is not allowed by restriction policy."
         )
 
+    def _get_restriction_service(self) -> Optional["ModelRestrictionService"]:
+        """Return the restriction service consulted by capability and listing checks."""
+
+        try:
+            from utils.model_restrictions import get_restriction_service
+        except Exception:  # pragma: no cover - only triggered if service import breaks
+            return None
+
+        return get_restriction_service()
+
     def _finalise_capabilities(
         self,
         capabilities: ModelCapabilities,
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, ClassVar, Optional
 
 if TYPE_CHECKING:
     from tools.models import ToolModelCategory
+    from utils.model_restrictions import ModelRestrictionService
 
 from .openai_compatible import OpenAICompatibleProvider
 from .registries.xai import XAIModelRegistry
@@ -26,18 +27,87 @@ class XAIModelProvider(RegistryBackedProviderMixin, OpenAICompatibleProvider):
     REGISTRY_CLASS = XAIModelRegistry
     MODEL_CAPABILITIES: ClassVar[dict[str, ModelCapabilities]] = {}
 
+    # Flat ``{lowercased alias or model name: canonical name}`` index, rebuilt on registry load.
+    _alias_index: ClassVar[dict[str, str]] = {}
+
+    # Lazily memoized ``{canonical name: capabilities}`` lookups, reset alongside the alias index.
+    _capabilities_cache: ClassVar[dict[str, ModelCapabilities]] = {}
+
     # Canonical model identifiers used for category routing.
     PRIMARY_MODEL = "grok-4-1-fast-non-reasoning"
     FALLBACK_MODEL = "grok-code-fast-1"
 
-    def __init__(self, api_key: str, **kwargs):
-        """Initialize X.AI provider with API key."""
+    def __init__(
+        self,
+        api_key: str,
+        restriction_service: Optional["ModelRestrictionService"] = None,
+        **kwargs,
+    ):
+        """Initialize X.AI provider with API key.
+
+        Args:
+            api_key: X.AI API key
+            restriction_service: Optional restriction service to consult instead
+                of the process-wide singleton and the XAI_ALLOWED_MODELS
+                allow-list (mainly for tests)
+        """
+        self._restriction_service = restriction_service
         # Set X.AI base URL
         kwargs.setdefault("base_url", "https://api.x.ai/v1")
         self._ensure_registry()
         super().__init__(api_key, **kwargs)
         self._invalidate_capability_cache()
 
+    @classmethod
+    def _ensure_registry(cls, *, force_reload: bool = False) -> None:
+        """Load the registry and rebuild the alias index if it was (re)built."""
+        registry = cls._registry
+        super()._ensure_registry(force_reload=force_reload)
+        if force_reload or cls._registry is not registry:
+            index = {
+                alias.lower(): model_name
+                for model_name, capabilities in cls.MODEL_CAPABILITIES.items()
+                for alias in capabilities.aliases
+            }
+            # Canonical names win over aliases, matching the base resolution order
+            index.update({model_name.lower(): model_name for model_name in cls.MODEL_CAPABILITIES})
+            cls._alias_index = index
+            cls._capabilities_cache = {}
+
+    def _resolve_model_name(self, model_name: str) -> str:
+        """Resolve model shorthand to full name with a single index lookup."""
+        return self._alias_index.get(model_name.lower(), model_name)
+
+    def _lookup_capabilities(
+        self,
+        canonical_name: str,
+        requested_name: Optional[str] = None,
+    ) -> Optional[ModelCapabilities]:
+        """Return memoized capabilities for a resolved model name.
+
+        Only hits are cached, so unsupported names still raise from
+        ``get_capabilities``. The restriction check runs after this lookup on
+        every call and is never memoized.
+        """
+        capabilities = self._capabilities_cache.get(canonical_name)
+        if capabilities is None:
+            capabilities = super()._lookup_capabilities(canonical_name, requested_name)
+            if capabilities is not None:
+                self._capabilities_cache[canonical_name] = capabilities
+        return capabilities
+
+    def _get_restriction_service(self) -> Optional["ModelRestrictionService"]:
+        """Prefer the injected restriction service over the global singleton."""
+        if self._restriction_service is not None:
+            return self._restriction_service
+        return super()._get_restriction_service()
+
+    def _parse_allowed_models(self) -> Optional[set[str]]:
+        """Skip the env allow-list when a restriction service was injected; it is authoritative."""
+        if self._restriction_service is not None:
+            return None
+        return super()._parse_allowed_models()
+
     def get_provider_type(self) -> ProviderType:
         """Get the provider type."""
         return ProviderType.XAI
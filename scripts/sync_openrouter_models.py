@@ -20,19 +20,41 @@ Intelligence Scoring:
 - Score range: 1-20 (5=base, 10=standard, 15+=advanced)
 
 Usage:
-    python scripts/sync_openrouter_models.py [--output PATH] [--keep-aliases]
+    python scripts/sync_openrouter_models.py [--output PATH] [--keep-aliases] [--no-cache]
 
 Options:
     --output PATH           Path to output config file (default: conf/openrouter_models.json)
     --keep-aliases          Preserve aliases from existing config (preserves custom scores too)
+    --no-cache              Ignore the cached catalog in ~/.cache/pal-mcp and download it again
 """
 
 import argparse
+import gzip
 import json
 import logging
 import os
+import re
 import sys
+import time
+import urllib.error
 import urllib.request
+from collections.abc import Iterable, Iterator
+
+try:  # pragma: no cover - optional dependency
+    import ijson
+
+    try:
+        # The C backend is dramatically faster than the pure-python fallback
+        ijson = ijson.get_backend("yajl2_c")
+    except ImportError:
+        pass
+except ImportError:  # pragma: no cover
+    ijson = None
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 # Setup logging
 logging.basicConfig(
@@ -41,37 +63,211 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Models created after this timestamp are considered recent by the scoring heuristic
+_SIX_MONTHS_AGO = time.time() - (6 * 30 * 24 * 3600)
+
+# Unfiltered /models response from the last successful fetch, keyed by its ETag
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pal-mcp")
+MODELS_CACHE_PATH = os.path.join(CACHE_DIR, "openrouter_models.json.gz")
+
+# Name keywords used by estimate_intelligence_score (matched as substrings)
+_REASONING_TERMS = frozenset({"reasoning", "r1", "deep-research", "deep-think"})
+_THINKING_TERMS = frozenset({"thinking", "pro"})
+_LARGE_TERMS = frozenset({"70b", "405b", "480b", "1.7", "large", "max"})
+_SMALL_TERMS = frozenset({"mini", "small", "lite", "3b", "8b"})
+
+
+def _compile_terms(terms: frozenset[str]) -> re.Pattern[str]:
+    """Compile keywords into one alternation so a name is scanned once per keyword group."""
+    return re.compile("|".join(re.escape(term) for term in sorted(terms)))
+
+
+_REASONING_RE = _compile_terms(_REASONING_TERMS)
+_THINKING_RE = _compile_terms(_THINKING_TERMS)
+_LARGE_RE = _compile_terms(_LARGE_TERMS)
+_SMALL_RE = _compile_terms(_SMALL_TERMS)
+
+
+def parse_api_models(stream) -> Iterator[tuple[str, dict]]:
+    """Stream-parse an OpenRouter /models response body without filtering.
+
+    Models are decoded one at a time (via ijson when available); entries
+    without an id are skipped.
+
+    Args:
+        stream: Binary file-like object containing the JSON response
+
+    Yields:
+        (model_id, model_info) tuples for every model in the catalog
+    """
+    if ijson is not None:
+        models = ijson.items(stream, "data.item", use_float=True)
+    else:
+        models = json.load(stream).get("data", [])
+
+    for model in models:
+        model_id = model.get("id")
+        if model_id:
+            yield model_id, model
+
+
+def filter_api_models(api_models: Iterable[tuple[str, dict]]) -> Iterator[tuple[str, dict]]:
+    """Yield only the (model_id, model_info) pairs that pass ``should_include_model``.
+
+    Args:
+        api_models: (model_id, model_info) pairs, e.g. from ``parse_api_models``
+
+    Yields:
+        (model_id, model_info) tuples for models that should be included
+    """
+    filtered_count = 0
+    included_count = 0
+
+    for model_id, model in api_models:
+        if not should_include_model(model_id, model):
+            filtered_count += 1
+            continue
+
+        included_count += 1
+        logger.debug(f"Found model: {model_id}")
+        yield model_id, model
+
+    logger.info(f"Filtered out {filtered_count} models, keeping {included_count}")
+
+
+def iter_api_models(stream) -> Iterator[tuple[str, dict]]:
+    """Stream-parse an OpenRouter /models response body, keeping only included models.
+
+    Each model is passed through ``should_include_model`` as soon as it is
+    decoded, so filtered-out entries are discarded without ever holding the
+    full catalog in memory.
+
+    Args:
+        stream: Binary file-like object containing the JSON response
+
+    Yields:
+        (model_id, model_info) tuples for models that should be included
+    """
+    return filter_api_models(parse_api_models(stream))
+
+
+def _read_models(stream, keep_catalog: bool) -> tuple[dict | None, dict]:
+    """Parse a /models body into ``(unfiltered catalog, filtered models)``.
+
+    The unfiltered catalog is only materialized when it is going to be cached;
+    otherwise models are filtered while streaming and ``None`` is returned in
+    its place.
+    """
+    if not keep_catalog:
+        return None, dict(iter_api_models(stream))
+
+    catalog = dict(parse_api_models(stream))
+    return catalog, dict(filter_api_models(catalog.items()))
+
+
+def _read_cache_file(path: str) -> dict | None:
+    """Read a gzipped JSON cache file, returning None if it is missing or unreadable."""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache file {path}: {e}")
+        return None
+
+    return data if isinstance(data, dict) else None
+
+
+def _write_cache_file(path: str, data: dict) -> None:
+    """Atomically write ``data`` as gzipped JSON, logging (not raising) on failure."""
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write cache file {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_models_cache() -> dict | None:
+    """Load the cached OpenRouter catalog written by ``save_models_cache``.
+
+    Returns:
+        Dict with ``etag`` and ``catalog`` keys, or None if no usable cache exists
+    """
+    cache = _read_cache_file(MODELS_CACHE_PATH)
+    if not cache or not cache.get("etag") or not isinstance(cache.get("catalog"), dict):
+        return None
+    return cache
+
+
+def save_models_cache(etag: str, catalog: dict) -> None:
+    """Atomically write the unfiltered catalog and its ETag to the cache file.
+
+    The catalog is stored before ``should_include_model`` runs, so edits to
+    the provider lists or filtering rules apply to cached runs as well.
+
+    Args:
+        etag: ETag header returned with the catalog
+        catalog: Every model returned by OpenRouter, keyed by model id
+    """
+    _write_cache_file(MODELS_CACHE_PATH, {"etag": etag, "catalog": catalog})
+
 
-def get_openrouter_models(api_key: str | None = None) -> dict:
+def get_openrouter_models(api_key: str | None = None, use_cache: bool = True) -> dict:
     """Fetch all available models from OpenRouter's API.
 
+    When ``use_cache`` is set, the request carries the ETag of the last fetch
+    and a 304 Not Modified response is served from the on-disk cache without
+    re-downloading or re-parsing the catalog.
+
     Args:
         api_key: Optional OpenRouter API key for authenticated requests
+        use_cache: If True, revalidate against and update the on-disk cache
 
     Returns:
-        dict mapping model_name -> model_info from OpenRouter API
+        dict mapping model_name -> model_info for models that pass ``should_include_model``
     """
     url = "https://openrouter.ai/api/v1/models"
 
     logger.info(f"Fetching models from {url}...")
 
+    cache = load_models_cache() if use_cache else None
+
     try:
         request = urllib.request.Request(url)
+        request.add_header("Accept-Encoding", "gzip")
         if api_key:
             request.add_header("Authorization", f"Bearer {api_key}")
+        if cache:
+            request.add_header("If-None-Match", cache["etag"])
+
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                etag = response.headers.get("ETag")
+                # urllib doesn't decompress transparently, so unwrap gzip bodies before parsing
+                if response.headers.get("Content-Encoding") == "gzip":
+                    with gzip.GzipFile(fileobj=response) as body:
+                        catalog, models = _read_models(body, keep_catalog=use_cache)
+                else:
+                    catalog, models = _read_models(response, keep_catalog=use_cache)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cache:
+                logger.info(f"OpenRouter catalog unchanged, reusing {len(cache['catalog'])} cached models")
+                return dict(filter_api_models(cache["catalog"].items()))
+            raise
 
-        with urllib.request.urlopen(request, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
+        logger.info(f"Successfully fetched {len(models)} models from OpenRouter")
 
-        models = {}
-        if "data" in data:
-            for model in data["data"]:
-                model_id = model.get("id")
-                if model_id:
-                    models[model_id] = model
-                    logger.debug(f"Found model: {model_id}")
+        if use_cache and etag:
+            save_models_cache(etag, catalog)
 
-        logger.info(f"Successfully fetched {len(models)} models from OpenRouter")
         return models
 
     except Exception as e:
@@ -79,34 +275,67 @@ def get_openrouter_models(api_key: str | None = None) -> dict:
         raise
 
 
-def estimate_intelligence_score(api_model: dict) -> int:
-    """Estimate intelligence score based on OpenRouter metadata.
+def _specialist_bonus(model_id: str, name: str) -> int:
+    """Score bonus for known frontier specialists, from the lowercased model id and name."""
+    # Specialized high-capability models - these are frontier specialists
+    # These are your requested top models - boost them significantly
+    if "grok" in model_id and ("grok-4" in model_id or "grok-code" in model_id):
+        return 4  # xAI Grok 4 or Grok Code
+    elif "minimax" in model_id:
+        return 4  # MiniMax frontier
+    elif "qwen3-coder" in model_id or ("qwen" in model_id and "coder" in name):
+        return 4  # Qwen3 code specialist
+    elif "glm" in model_id and ("glm-4.6" in model_id or "glm 4.6" in name):
+        return 4  # GLM 4.6 latest
+    # Legacy handling: grok-3 models are deprecated but may still appear in OpenRouter's API
+    elif "grok-3" in model_id or "grok 3" in name:
+        return 2
+    elif "qwen3" in model_id or "qwen3" in name:
+        return 2
+    elif ("glm-4" in model_id or "glm 4" in name) and "4.5" not in model_id and "4.5" not in name:
+        return 1
+    elif "glm-4.5" in model_id or "glm 4.5" in name:
+        return 2
+    elif "jamba" in name and ("large" in name or "premier" in name):
+        return 2
+    return 0
 
-    Uses model characteristics (context size, reasoning capability, recency, specialization) to
-    estimate capability level 1-20. This is a heuristic since OpenRouter doesn't
-    provide official rankings.
+
+def _score_core(
+    created: int,
+    context: int,
+    reasoning: bool,
+    thinking: bool,
+    specialist_bonus: int,
+    large: bool,
+    small: bool,
+    vision: bool,
+) -> int:
+    """Numeric part of the intelligence heuristic, operating on pre-decoded fields and flags.
+
+    Kept free of string and dict work so the arithmetic cascade stays a tight
+    sequence of integer comparisons.
 
     Args:
-        api_model: Model dict from OpenRouter API
+        created: Model creation timestamp (seconds since epoch)
+        context: Context window length in tokens
+        reasoning: Name indicates a reasoning model
+        thinking: Name indicates a thinking/pro model
+        specialist_bonus: Bonus awarded for known frontier specialists
+        large: Name indicates a large model tier
+        small: Name indicates a small model tier
+        vision: Model accepts image input
 
     Returns:
-        Estimated intelligence score 1-20
+        Score clamped to the 1-20 range
     """
     score = 5  # Base score
 
-    model_id = api_model.get("id", "").lower()
-    name = api_model.get("name", "").lower()
-    created = api_model.get("created", 0)
-
     # Reward recent models (created in last 6 months)
-    import time
-
-    six_months_ago = time.time() - (6 * 30 * 24 * 3600)
-    if created > six_months_ago:
+    if created > _SIX_MONTHS_AGO:
         score += 2
 
     # Context window indicators
-    context = api_model.get("context_length", 32768)
     if context >= 1000000:  # 1M+ context (frontier)
         score += 4
     elif context >= 256000:  # 256K+ context
@@ -117,48 +346,92 @@ def estimate_intelligence_score(api_model: dict) -> int:
         score += 1
 
     # Reasoning/thinking capability
-    if any(term in name for term in ["reasoning", "r1", "deep-research", "deep-think"]):
+    if reasoning:
         score += 3
-    elif any(term in name for term in ["thinking", "pro"]):
+    elif thinking:
         score += 2
 
-    # Specialized high-capability models - these are frontier specialists
-    # These are your requested top models - boost them significantly
-    if "grok" in model_id and ("grok-4" in model_id or "grok-code" in model_id):
-        score += 4  # xAI Grok 4 or Grok Code
-    elif "minimax" in model_id:
-        score += 4  # MiniMax frontier
-    elif "qwen3-coder" in model_id or ("qwen" in model_id and "coder" in name):
-        score += 4  # Qwen3 code specialist
-    elif "glm" in model_id and ("glm-4.6" in model_id or "glm 4.6" in name):
-        score += 4  # GLM 4.6 latest
-    # Legacy handling: grok-3 models are deprecated but may still appear in OpenRouter's API
-    elif "grok-3" in model_id or "grok 3" in name:
-        score += 2
-    elif "qwen3" in model_id or "qwen3" in name:
-        score += 2
-    elif ("glm-4" in model_id or "glm 4" in name) and "4.5" not in model_id and "4.5" not in name:
-        score += 1
-    elif "glm-4.5" in model_id or "glm 4.5" in name:
-        score += 2
-    elif "jamba" in name and ("large" in name or "premier" in name):
-        score += 2
+    score += specialist_bonus
 
     # Model series/tier indicators
-    if any(term in name for term in ["70b", "405b", "480b", "1.7", "large", "max"]):
+    if large:
         score += 2
-    elif any(term in name for term in ["mini", "small", "lite", "3b", "8b"]):
+    elif small:
         score -= 1
 
     # Vision/multimodal capability
-    architecture = api_model.get("architecture", {})
-    if "vision" in str(architecture).lower() or "image" in api_model.get("supported_parameters", []):
+    if vision:
         score += 1
 
     # Clamp to 1-20 range
     return max(1, min(20, score))
 
 
+def _accepts_images(architecture: dict) -> bool:
+    """Return True when the model architecture lists image input or a vision modality."""
+    return (
+        "image" in (architecture.get("input_modalities") or [])
+        or "vision" in (architecture.get("modality") or "").lower()
+    )
+
+
+def estimate_intelligence_score(
+    model_id: str,
+    name: str,
+    created: int,
+    context: int,
+    accepts_images: bool,
+    supported_parameters: list,
+) -> int:
+    """Estimate intelligence score based on OpenRouter metadata.
+
+    Uses model characteristics (context size, reasoning capability, recency, specialization) to
+    estimate capability level 1-20. This is a heuristic since OpenRouter doesn't
+    provide official rankings.
+
+    Takes fields already pulled out of the API model by ``extract_model_capabilities``
+    so each model dict is only traversed once.
+
+    Args:
+        model_id: Lowercased model identifier
+        name: Lowercased display name
+        created: Model creation timestamp (seconds since epoch)
+        context: Context window length in tokens
+        accepts_images: Whether the model's architecture accepts image input (``_accepts_images``)
+        supported_parameters: The model's ``supported_parameters`` list
+
+    Returns:
+        Estimated intelligence score 1-20
+    """
+    return _score_core(
+        created,
+        context,
+        _REASONING_RE.search(name) is not None,
+        _THINKING_RE.search(name) is not None,
+        _specialist_bonus(model_id, name),
+        _LARGE_RE.search(name) is not None,
+        _SMALL_RE.search(name) is not None,
+        accepts_images or "image" in supported_parameters,
+    )
+
+
+# Defaults for every capability field, in output order; copied and filled in per model
+_CAPABILITIES_TEMPLATE = {
+    "model_name": "",
+    "aliases": (),
+    "context_window": 32768,
+    "max_output_tokens": 32768,
+    "supports_json_mode": True,  # Most OpenRouter models support JSON
+    "supports_function_calling": True,  # Most OpenRouter models support functions
+    "supports_extended_thinking": False,  # Default to false unless specified
+    "supports_images": False,
+    "max_image_size_mb": 0.0,
+    "supports_temperature": True,  # Most models support temperature
+    "description": "",
+    "intelligence_score": 5,
+}
+
+
 def extract_model_capabilities(api_model: dict) -> dict:
     """Extract model capabilities from OpenRouter API response.
 
@@ -168,27 +441,39 @@ def extract_model_capabilities(api_model: dict) -> dict:
     Returns:
         Dict with capability fields for our config format
     """
-    capabilities = {
-        "model_name": api_model.get("id", ""),
-        "aliases": [],
-        "context_window": api_model.get("context_length", 32768),
-        "max_output_tokens": api_model.get("max_completion_tokens", 32768),
-        "supports_json_mode": True,  # Most OpenRouter models support JSON
-        "supports_function_calling": True,  # Most OpenRouter models support functions
-        "supports_extended_thinking": False,  # Default to false unless specified
-        "supports_images": "vision" in api_model.get("architecture", {}).get("modality", "").lower()
-        or "multimodal" in api_model.get("name", "").lower(),
-        "max_image_size_mb": 20.0 if "vision" in str(api_model).lower() else 0.0,
-        "supports_temperature": True,  # Most models support temperature
-        "description": api_model.get("description", ""),
-        "intelligence_score": estimate_intelligence_score(api_model),
-    }
-
+    # Read every field once; capability extraction and scoring share these locals
+    model_id = api_model.get("id", "")
+    model_id_lower = model_id.lower()
+    name_lower = api_model.get("name", "").lower()
+    context = api_model.get("context_length", 32768)
+    architecture = api_model.get("architecture") or {}
+    accepts_images = _accepts_images(architecture)
+    supports_images = accepts_images or "multimodal" in name_lower
+
+    capabilities = _CAPABILITIES_TEMPLATE.copy()
+    capabilities["model_name"] = model_id
+    capabilities["aliases"] = []  # Fresh list; the template's tuple is shared
+    capabilities["context_window"] = context
+    capabilities["max_output_tokens"] = api_model.get("max_completion_tokens", 32768)
     # Handle thinking/reasoning capability
-    if "reasoning" in api_model.get("name", "").lower() or "r1" in api_model.get("id", "").lower():
-        capabilities["supports_extended_thinking"] = True
+    capabilities["supports_extended_thinking"] = "reasoning" in name_lower or "r1" in model_id_lower
+    if supports_images:
+        capabilities["supports_images"] = True
+        capabilities["max_image_size_mb"] = 20.0
+    capabilities["description"] = api_model.get("description", "")
+    capabilities["intelligence_score"] = estimate_intelligence_score(
+        model_id_lower,
+        name_lower,
+        api_model.get("created", 0),
+        context,
+        accepts_images,
+        api_model.get("supported_parameters", []),
+    )
 
-    return {k: v for k, v in capabilities.items() if v is not None}
+    # Fields the API sends as explicit nulls (e.g. max_completion_tokens) are dropped; most models have none
+    if any(v is None for v in capabilities.values()):
+        return {k: v for k, v in capabilities.items() if v is not None}
+    return capabilities
 
 
 def load_existing_config(config_path: str) -> dict:
@@ -204,7 +489,7 @@ def load_existing_config(config_path: str) -> dict:
         return {"_README": {}, "models_by_name": {}}
 
     try:
-        with open(config_path) as f:
+        with open(config_path, encoding="utf-8") as f:
             config = json.load(f)
 
         models_by_name = {}
@@ -254,42 +539,21 @@ OPENROUTER_FRONTIER_MODELS = {
 }
 
 
-def should_include_model(model_id: str, api_model: dict) -> bool:
-    """Determine if a model should be included in the config.
-
-    Includes alternative, open-source, and specialized models while excluding:
-    - Models from providers available via native APIs (OpenAI, Google, Anthropic, X.AI, Perplexity)
-    - Free tier limited models (:free suffix)
-    - Niche/experimental models from unknown providers
-    - Deprecated/old versions
-
-    Args:
-        model_id: Model identifier
-        api_model: Model data from API
-
-    Returns:
-        True if model should be included
-    """
-    # Exclude free tier variants
-    if ":free" in model_id:
-        return False
-
-    # Exclude providers available via native APIs (already in openai_models.json, gemini_models.json, xai_models.json)
-    # NOTE: X.AI kept here despite having native API because we want Grok code specialist variants
-    excluded_providers = {
+# Providers available via native APIs (already in openai_models.json, gemini_models.json, xai_models.json)
+# NOTE: X.AI kept here despite having native API because we want Grok code specialist variants
+_EXCLUDED_PROVIDERS = frozenset(
+    {
         "openai",  # Use native OpenAI API instead
         "google",  # Use native Gemini API instead
         "anthropic",  # Use native Claude via Anthropic API instead
         # "x-ai",        # KEEP: Grok-4, Grok Code specialists are valuable
         "perplexity",  # Reasoning/search models - less priority
     }
+)
 
-    provider = model_id.split("/")[0]
-    if provider in excluded_providers:
-        return False
-
-    # Include major open and specialized model providers
-    preferred_providers = {
+# Major open and specialized model providers
+_PREFERRED_PROVIDERS = frozenset(
+    {
         # OpenRouter frontier models (bleeding edge)
         "openrouter",  # OpenRouter-authored frontier models
         # Frontier reasoning & specialized
@@ -316,105 +580,170 @@ def should_include_model(model_id: str, api_model: dict) -> bool:
         "liquid",  # Liquid AI - efficient models
         "nvidia",  # NVIDIA models
     }
+)
+
+
+def _compile_provider_prefix(providers: frozenset[str]) -> re.Pattern[str]:
+    """Compile providers into a regex matching the ``provider/`` prefix of a model id."""
+    return re.compile(rf"^(?:{'|'.join(re.escape(p) for p in sorted(providers))})(?:/|$)")
+
+
+_EXCLUDED_PROVIDER_RE = _compile_provider_prefix(_EXCLUDED_PROVIDERS)
+_PREFERRED_PROVIDER_RE = _compile_provider_prefix(_PREFERRED_PROVIDERS)
+
+
+def should_include_model(model_id: str, api_model: dict) -> bool:
+    """Determine if a model should be included in the config.
+
+    Includes alternative, open-source, and specialized models while excluding:
+    - Models from providers available via native APIs (OpenAI, Google, Anthropic, X.AI, Perplexity)
+    - Free tier limited models (:free suffix)
+    - Niche/experimental models from unknown providers
+    - Deprecated/old versions
+
+    Args:
+        model_id: Model identifier
+        api_model: Model data from API
+
+    Returns:
+        True if model should be included
+    """
+    # Exclude free tier variants
+    if ":free" in model_id:
+        return False
+
+    # Exclude providers available via native APIs
+    if _EXCLUDED_PROVIDER_RE.match(model_id):
+        return False
 
-    if provider in preferred_providers:
+    # Include major open and specialized model providers
+    if _PREFERRED_PROVIDER_RE.match(model_id):
         return True
 
     # For other providers, only include if they have published pricing and are reasonably named
     pricing = api_model.get("pricing", {})
     if pricing and (pricing.get("prompt") or pricing.get("completion")):
         # Include models with pricing data from providers with longer names (filters noise)
-        return len(provider) > 2
+        return len(model_id.partition("/")[0]) > 2
 
     return False
 
 
-def merge_model_configs(api_models: dict, existing_config: dict, keep_aliases: bool = False) -> list[dict]:
-    """Merge API models with curated config data.
+# Hand-curated fields that always win over API-derived values when present in the existing config
+_CURATED_FIELDS = frozenset(
+    {
+        "supports_json_mode",
+        "supports_function_calling",
+        "supports_extended_thinking",
+        "supports_images",
+        "supports_temperature",
+        "temperature_constraint",
+        "use_openai_response_api",
+        "default_reasoning_effort",
+        "allow_code_generation",
+    }
+)
+
+
+def process_model(
+    model_id: str,
+    api_model: dict,
+    existing: dict | None,
+    keep_aliases: bool,
+    frontier: dict | None = None,
+) -> dict:
+    """Build the config entry for a single API model in one pass, layering curated data on top.
 
     Args:
-        api_models: Models from OpenRouter API
-        existing_config: Existing config with curated data
+        model_id: Model identifier
+        api_model: Model data from API
+        existing: Curated entry for this model from the existing config, if any
         keep_aliases: If True, preserve aliases from existing config
+        frontier: Optional frontier model specs (model_id -> overrides) applied last
 
     Returns:
-        List of merged model dicts
+        Merged model dict
     """
-    merged_models = []
-    existing_by_name = existing_config.get("models_by_name", {})
+    # Start with API-extracted capabilities
+    model_config = extract_model_capabilities(api_model)
 
-    filtered_count = 0
-    included_count = 0
+    # Merge with existing curated data
+    if existing is not None:
+        # Preserve curated aliases if requested
+        if keep_aliases and "aliases" in existing:
+            model_config["aliases"] = existing["aliases"]
 
-    for model_id, api_model in sorted(api_models.items()):
-        if not should_include_model(model_id, api_model):
-            filtered_count += 1
-            continue
+        # Preserve curated intelligence score only if keep_aliases is True
+        if keep_aliases and "intelligence_score" in existing:
+            model_config["intelligence_score"] = existing["intelligence_score"]
 
-        included_count += 1
+        # Preserve other curated fields (in the existing entry's order, so output stays deterministic)
+        model_config.update({field: value for field, value in existing.items() if field in _CURATED_FIELDS})
 
-        # Start with API-extracted capabilities
-        model_config = extract_model_capabilities(api_model)
-
-        # Merge with existing curated data
-        if model_id in existing_by_name:
-            existing = existing_by_name[model_id]
-
-            # Preserve curated aliases if requested
-            if keep_aliases and "aliases" in existing:
-                model_config["aliases"] = existing["aliases"]
-
-            # Preserve curated intelligence score only if keep_aliases is True
-            if keep_aliases and "intelligence_score" in existing:
-                model_config["intelligence_score"] = existing["intelligence_score"]
-
-            # Preserve other curated fields
-            for field in [
-                "supports_json_mode",
-                "supports_function_calling",
-                "supports_extended_thinking",
-                "supports_images",
-                "supports_temperature",
-                "temperature_constraint",
-                "use_openai_response_api",
-                "default_reasoning_effort",
-                "allow_code_generation",
-            ]:
-                if field in existing:
-                    model_config[field] = existing[field]
-
-        merged_models.append(model_config)
+    # Override with frontier model specs
+    if frontier and model_id in frontier:
+        model_config.update(frontier[model_id])
 
-    logger.info(f"Filtered out {filtered_count} models, keeping {included_count}")
+    return model_config
+
+
+def merge_model_configs(
+    api_models: Iterable[tuple[str, dict]],
+    existing_config: dict,
+    keep_aliases: bool = False,
+    frontier: dict | None = None,
+) -> list[dict]:
+    """Merge API models with curated config data.
+
+    Runs serially on purpose: the whole catalog merges in a few milliseconds,
+    less than it costs to start a process pool.
+
+    Args:
+        api_models: (model_id, model_info) pairs from OpenRouter API, already filtered
+        existing_config: Existing config with curated data
+        keep_aliases: If True, preserve aliases from existing config
+        frontier: Optional frontier model specs (model_id -> overrides), e.g. OPENROUTER_FRONTIER_MODELS
+
+    Returns:
+        List of merged model dicts
+    """
+    existing_models = existing_config.get("models_by_name", {})
+
+    merged_models = [
+        process_model(model_id, api_model, existing_models.get(model_id), keep_aliases, frontier)
+        for model_id, api_model in api_models
+    ]
+
+    # Sort the final entries rather than the incoming pairs so only kept models are ordered
+    merged_models.sort(key=lambda model: model["model_name"])
     return merged_models
 
 
-def generate_readme() -> dict:
-    """Generate README section for the config file."""
-    return {
-        "description": "Model metadata for OpenRouter-backed providers.",
-        "documentation": "https://github.com/BeehiveInnovations/zen-mcp-server/blob/main/docs/custom_models.md",
-        "usage": "Models listed here are exposed through OpenRouter. Aliases are case-insensitive.",
-        "field_notes": "Matches providers/shared/model_capabilities.py.",
-        "field_descriptions": {
-            "model_name": "The model identifier - OpenRouter format (e.g., 'anthropic/claude-opus-4') or custom model name (e.g., 'llama3.2')",
-            "aliases": "Array of short names users can type instead of the full model name",
-            "context_window": "Total number of tokens the model can process (input + output combined)",
-            "max_output_tokens": "Maximum number of tokens the model can generate in a single response",
-            "supports_extended_thinking": "Whether the model supports extended reasoning tokens (currently none do via OpenRouter or custom APIs)",
-            "supports_json_mode": "Whether the model can guarantee valid JSON output",
-            "supports_function_calling": "Whether the model supports function/tool calling",
-            "supports_images": "Whether the model can process images/visual input",
-            "max_image_size_mb": "Maximum total size in MB for all images combined (capped at 40MB max for custom models)",
-            "supports_temperature": "Whether the model accepts temperature parameter in API calls (set to false for O3/O4 reasoning models)",
-            "temperature_constraint": "Type of temperature constraint: 'fixed' (fixed value), 'range' (continuous range), 'discrete' (specific values), or omit for default range",
-            "use_openai_response_api": "Set to true when the model must use the /responses endpoint (reasoning models like GPT-5 Pro). Leave false/omit for standard chat completions.",
-            "default_reasoning_effort": "Default reasoning effort level for models that support it (e.g., 'low', 'medium', 'high'). Omit if not applicable.",
-            "description": "Human-readable description of the model",
-            "intelligence_score": "1-20 human rating used as the primary signal for auto-mode model ordering",
-            "allow_code_generation": "Whether this model can generate and suggest fully working code - complete with functions, files, and detailed implementation instructions - for your AI tool to use right away. Only set this to 'true' for a model more capable than the AI model / CLI you're currently using.",
-        },
-    }
+# README section written at the top of the generated config file
+_README = {
+    "description": "Model metadata for OpenRouter-backed providers.",
+    "documentation": "https://github.com/BeehiveInnovations/zen-mcp-server/blob/main/docs/custom_models.md",
+    "usage": "Models listed here are exposed through OpenRouter. Aliases are case-insensitive.",
+    "field_notes": "Matches providers/shared/model_capabilities.py.",
+    "field_descriptions": {
+        "model_name": "The model identifier - OpenRouter format (e.g., 'anthropic/claude-opus-4') or custom model name (e.g., 'llama3.2')",
+        "aliases": "Array of short names users can type instead of the full model name",
+        "context_window": "Total number of tokens the model can process (input + output combined)",
+        "max_output_tokens": "Maximum number of tokens the model can generate in a single response",
+        "supports_extended_thinking": "Whether the model supports extended reasoning tokens (currently none do via OpenRouter or custom APIs)",
+        "supports_json_mode": "Whether the model can guarantee valid JSON output",
+        "supports_function_calling": "Whether the model supports function/tool calling",
+        "supports_images": "Whether the model can process images/visual input",
+        "max_image_size_mb": "Maximum total size in MB for all images combined (capped at 40MB max for custom models)",
+        "supports_temperature": "Whether the model accepts temperature parameter in API calls (set to false for O3/O4 reasoning models)",
+        "temperature_constraint": "Type of temperature constraint: 'fixed' (fixed value), 'range' (continuous range), 'discrete' (specific values), or omit for default range",
+        "use_openai_response_api": "Set to true when the model must use the /responses endpoint (reasoning models like GPT-5 Pro). Leave false/omit for standard chat completions.",
+        "default_reasoning_effort": "Default reasoning effort level for models that support it (e.g., 'low', 'medium', 'high'). Omit if not applicable.",
+        "description": "Human-readable description of the model",
+        "intelligence_score": "1-20 human rating used as the primary signal for auto-mode model ordering",
+        "allow_code_generation": "Whether this model can generate and suggest fully working code - complete with functions, files, and detailed implementation instructions - for your AI tool to use right away. Only set this to 'true' for a model more capable than the AI model / CLI you're currently using.",
+    },
+}
 
 
 def write_config(output_path: str, models: list[dict]) -> None:
@@ -425,7 +754,7 @@ def write_config(output_path: str, models: list[dict]) -> None:
         models: List of model configs to write
     """
     config = {
-        "_README": generate_readme(),
+        "_README": _README,
         "models": models,
     }
 
@@ -434,8 +763,13 @@ def write_config(output_path: str, models: list[dict]) -> None:
     if output_dir:
         os.makedirs(output_dir, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(config, f, indent=2)
+    # Both writers emit raw UTF-8 with the same layout, so the file doesn't depend on orjson being installed
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(config, f, indent=2, ensure_ascii=False)
 
     logger.info(f"Updated config written to {output_path}")
     logger.info(f"Total models: {len(models)}")
@@ -462,6 +796,11 @@ def main():
         action="store_true",
         help="Include OpenRouter frontier models (even if not yet in API)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download the full catalog instead of revalidating the local cache",
+    )
 
     args = parser.parse_args()
 
@@ -472,7 +811,7 @@ def main():
             logger.warning("OPENROUTER_API_KEY not set - requests may be rate-limited")
 
         # Fetch models from API
-        api_models = get_openrouter_models(api_key)
+        api_models = get_openrouter_models(api_key, use_cache=not args.no_cache)
 
         if not api_models:
             logger.error("No models returned from OpenRouter API")
@@ -489,23 +828,19 @@ def main():
                         "name": model_config.get("description", model_id),
                         "description": model_config.get("description", ""),
                         "context_length": model_config.get("context_window", 128000),
-                        "created": int(__import__("time").time()),
+                        "created": int(time.time()),
                     }
 
         # Load existing config for curation data
         existing_config = load_existing_config(args.output)
 
-        # Merge API data with curated config
-        merged_models = merge_model_configs(api_models, existing_config, keep_aliases=args.keep_aliases)
-
-        # Add frontier model overrides
-        if args.include_frontier:
-            for i, model in enumerate(merged_models):
-                model_id = model.get("model_name")
-                if model_id in OPENROUTER_FRONTIER_MODELS:
-                    frontier_config = OPENROUTER_FRONTIER_MODELS[model_id]
-                    # Override with frontier model specs
-                    merged_models[i].update(frontier_config)
+        # Merge API data with curated config, applying frontier model overrides in the same pass
+        merged_models = merge_model_configs(
+            api_models.items(),
+            existing_config,
+            keep_aliases=args.keep_aliases,
+            frontier=OPENROUTER_FRONTIER_MODELS if args.include_frontier else None,
+        )
 
         # Write updated config
         write_config(args.output, merged_models)
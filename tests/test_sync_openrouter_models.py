@@ -0,0 +1,255 @@
+"""Tests for scripts/sync_openrouter_models.py (catalog cache, capabilities and config writing)."""
+
+import gzip
+import io
+import json
+import urllib.error
+
+import pytest
+
+from scripts import sync_openrouter_models as sync
+
+CATALOG = {
+    "data": [
+        {"id": "mistralai/mistral-large", "name": "Mistral Large", "context_length": 128000},
+        {"id": "openai/gpt-5", "name": "GPT-5", "context_length": 400000},
+        {"id": "qwen/qwen3-coder", "name": "Qwen3 Coder", "context_length": 262144},
+    ]
+}
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal stand-in for the object returned by ``urllib.request.urlopen``."""
+
+    def __init__(self, body: bytes, headers: dict):
+        super().__init__(body)
+        self.headers = headers
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """Redirect the catalog cache into a temporary directory."""
+    path = tmp_path / "openrouter_models.json.gz"
+    monkeypatch.setattr(sync, "MODELS_CACHE_PATH", str(path))
+    return path
+
+
+@pytest.fixture
+def urlopen(monkeypatch):
+    """Patch ``urlopen`` to serve queued responses and record the requests it received."""
+    responses = []
+    requests = []
+
+    def fake_urlopen(request, timeout=None):
+        requests.append(request)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(sync.urllib.request, "urlopen", fake_urlopen)
+    return responses, requests
+
+
+def _ok(etag=None, compress=False):
+    body = json.dumps(CATALOG).encode("utf-8")
+    headers = {}
+    if etag:
+        headers["ETag"] = etag
+    if compress:
+        body = gzip.compress(body)
+        headers["Content-Encoding"] = "gzip"
+    return FakeResponse(body, headers)
+
+
+def _not_modified():
+    return urllib.error.HTTPError("https://openrouter.ai/api/v1/models", 304, "Not Modified", {}, None)
+
+
+def _write_cache(path, etag, catalog):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump({"etag": etag, "catalog": catalog}, f)
+
+
+class TestCatalogCache:
+    """ETag revalidation and on-disk caching of the OpenRouter catalog."""
+
+    def test_fetch_saves_unfiltered_catalog(self, cache_path, urlopen):
+        responses, _ = urlopen
+        responses.append(_ok(etag='"v1"'))
+
+        models = sync.get_openrouter_models()
+
+        assert sorted(models) == ["mistralai/mistral-large", "qwen/qwen3-coder"]
+        cache = sync.load_models_cache()
+        assert cache["etag"] == '"v1"'
+        # Excluded providers are still cached so later filter changes can include them
+        assert sorted(cache["catalog"]) == ["mistralai/mistral-large", "openai/gpt-5", "qwen/qwen3-coder"]
+
+    def test_not_modified_reuses_cache_and_refilters(self, cache_path, urlopen, monkeypatch):
+        responses, requests = urlopen
+        catalog = {model["id"]: model for model in CATALOG["data"]}
+        _write_cache(cache_path, '"v1"', catalog)
+        responses.append(_not_modified())
+
+        # A filter change after the catalog was cached must still apply on a 304
+        monkeypatch.setattr(sync, "should_include_model", lambda model_id, api_model: model_id.startswith("qwen/"))
+
+        models = sync.get_openrouter_models()
+
+        assert requests[0].get_header("If-none-match") == '"v1"'
+        assert list(models) == ["qwen/qwen3-coder"]
+
+    def test_missing_etag_does_not_write_cache(self, cache_path, urlopen):
+        responses, requests = urlopen
+        responses.append(_ok())
+
+        models = sync.get_openrouter_models()
+
+        assert len(models) == 2
+        assert requests[0].get_header("If-none-match") is None
+        assert not cache_path.exists()
+
+    def test_unreadable_cache_is_ignored(self, cache_path, urlopen):
+        responses, requests = urlopen
+        cache_path.write_bytes(b"not a gzip file")
+        responses.append(_ok(etag='"v2"'))
+
+        models = sync.get_openrouter_models()
+
+        assert len(models) == 2
+        assert requests[0].get_header("If-none-match") is None
+        assert sync.load_models_cache()["etag"] == '"v2"'
+
+    def test_legacy_filtered_cache_is_ignored(self, cache_path, urlopen):
+        responses, requests = urlopen
+        with gzip.open(cache_path, "wt", encoding="utf-8") as f:
+            json.dump({"etag": '"old"', "models": {}}, f)
+        responses.append(_ok(etag='"v3"'))
+
+        sync.get_openrouter_models()
+
+        assert requests[0].get_header("If-none-match") is None
+
+    def test_gzip_response_is_decoded(self, cache_path, urlopen):
+        responses, requests = urlopen
+        responses.append(_ok(etag='"v1"', compress=True))
+
+        models = sync.get_openrouter_models()
+
+        assert requests[0].get_header("Accept-encoding") == "gzip"
+        assert sorted(models) == ["mistralai/mistral-large", "qwen/qwen3-coder"]
+
+    def test_no_cache_skips_revalidation_and_write(self, cache_path, urlopen):
+        responses, requests = urlopen
+        _write_cache(cache_path, '"v1"', {})
+        responses.append(_ok(etag='"v2"'))
+
+        models = sync.get_openrouter_models(use_cache=False)
+
+        assert len(models) == 2
+        assert requests[0].get_header("If-none-match") is None
+        assert sync.load_models_cache()["etag"] == '"v1"'
+
+    def test_cache_write_creates_its_own_directory(self, tmp_path, monkeypatch):
+        path = tmp_path / "nested" / "cache" / "openrouter_models.json.gz"
+        monkeypatch.setattr(sync, "MODELS_CACHE_PATH", str(path))
+
+        sync.save_models_cache('"v1"', {})
+
+        assert sync.load_models_cache()["etag"] == '"v1"'
+
+    def test_failed_cache_write_removes_temp_file(self, cache_path, monkeypatch):
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(sync.os, "replace", failing_replace)
+
+        sync.save_models_cache('"v1"', {})
+
+        assert not cache_path.exists()
+        assert list(cache_path.parent.iterdir()) == []
+
+    def test_not_modified_without_cache_raises(self, cache_path, urlopen):
+        responses, _ = urlopen
+        responses.append(_not_modified())
+
+        with pytest.raises(urllib.error.HTTPError):
+            sync.get_openrouter_models()
+
+
+class TestWriteConfig:
+    """The written config must not depend on which JSON writer is installed."""
+
+    def test_orjson_and_stdlib_write_identical_bytes(self, tmp_path, monkeypatch):
+        orjson = pytest.importorskip("orjson")
+        models = [
+            {
+                "model_name": "mistralai/mistral-large",
+                "aliases": [],
+                "max_image_size_mb": 20.0,
+                "description": "Mistral’s flagship model — now with “smart” quotes",
+            }
+        ]
+
+        monkeypatch.setattr(sync, "orjson", orjson)
+        sync.write_config(str(tmp_path / "orjson.json"), models)
+        monkeypatch.setattr(sync, "orjson", None)
+        sync.write_config(str(tmp_path / "stdlib.json"), models)
+
+        written = (tmp_path / "stdlib.json").read_bytes()
+        assert (tmp_path / "orjson.json").read_bytes() == written
+        assert "Mistral’s flagship model —".encode() in written
+
+
+class TestImageCapabilities:
+    """Image support follows the architecture, not words in the description."""
+
+    def test_input_modalities_image_sets_image_budget(self):
+        api_model = {
+            "id": "mistralai/pixtral-large",
+            "name": "Mistral: Pixtral Large",
+            "description": "Multimodal flagship model",
+            "architecture": {"modality": "text+image->text", "input_modalities": ["text", "image"]},
+        }
+
+        capabilities = sync.extract_model_capabilities(api_model)
+
+        assert capabilities["supports_images"] is True
+        assert capabilities["max_image_size_mb"] == 20.0
+
+    def test_vision_in_description_does_not_imply_images(self):
+        api_model = {
+            "id": "mistralai/mistral-large",
+            "name": "Mistral Large",
+            "description": "Text model that pairs well with a separate vision encoder",
+            "architecture": {"modality": "text->text", "input_modalities": ["text"]},
+        }
+
+        capabilities = sync.extract_model_capabilities(api_model)
+
+        assert capabilities["supports_images"] is False
+        assert capabilities["max_image_size_mb"] == 0.0
+
+    def test_merge_keeps_architecture_image_flags(self):
+        api_models = {
+            "mistralai/pixtral-large": {
+                "id": "mistralai/pixtral-large",
+                "name": "Mistral: Pixtral Large",
+                "architecture": {"input_modalities": ["text", "image"]},
+            },
+            "mistralai/mistral-large": {
+                "id": "mistralai/mistral-large",
+                "name": "Mistral Large",
+                "description": "Strong at vision-language benchmarks when paired with an encoder",
+                "architecture": {"input_modalities": ["text"]},
+            },
+        }
+
+        merged = sync.merge_model_configs(api_models.items(), {"models_by_name": {}})
+
+        by_name = {model["model_name"]: model for model in merged}
+        assert by_name["mistralai/pixtral-large"]["max_image_size_mb"] == 20.0
+        assert by_name["mistralai/pixtral-large"]["supports_images"] is True
+        assert by_name["mistralai/mistral-large"]["max_image_size_mb"] == 0.0
+        assert by_name["mistralai/mistral-large"]["supports_images"] is False
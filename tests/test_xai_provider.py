@@ -1,38 +1,78 @@
 """Tests for X.AI provider implementation."""
 
-import os
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from providers.shared import ProviderType
+import utils.model_restrictions as model_restrictions
+from providers.shared import ModelCapabilities, ProviderType
 from providers.xai import XAIModelProvider
 
 
-class TestXAIProvider:
-    """Test X.AI provider functionality."""
+@pytest.fixture(scope="module")
+def xai_provider():
+    """Shared unrestricted provider for tests that don't depend on restriction env vars or a mocked client.
+
+    Module fixtures are built before conftest's function-scoped env clearing runs,
+    so the injected service is built with XAI_ALLOWED_MODELS cleared; the provider
+    itself ignores the env allow-list once a service is injected.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("XAI_ALLOWED_MODELS", raising=False)
+        restriction_service = model_restrictions.ModelRestrictionService()
+
+    return XAIModelProvider("test-key", restriction_service=restriction_service)
+
+
+@pytest.fixture(scope="module")
+def canonical_caps(xai_provider):
+    """Capabilities of the primary Grok model, looked up once for alias comparisons."""
+    return xai_provider.get_capabilities("grok-4-1-fast-non-reasoning")
 
-    def setup_method(self):
-        """Set up clean state before each test."""
-        # Clear restriction service cache before each test
-        import utils.model_restrictions
 
-        utils.model_restrictions._restriction_service = None
+@pytest.fixture
+def restrict(monkeypatch, request):
+    """Build a test-local restriction service from ``request.param`` as XAI_ALLOWED_MODELS.
 
-    def teardown_method(self):
-        """Clean up after each test to avoid singleton issues."""
-        # Clear restriction service cache after each test
-        import utils.model_restrictions
+    The service is injected into the provider rather than installed as the
+    process-wide singleton, so no global state needs resetting.
+    """
+    monkeypatch.setenv("XAI_ALLOWED_MODELS", request.param)
+    return model_restrictions.ModelRestrictionService()
 
-        utils.model_restrictions._restriction_service = None
 
-    @patch.dict(os.environ, {"XAI_API_KEY": "test-key"})
-    def test_initialization(self):
+def _fake_response(model="grok-4-1-fast-non-reasoning"):
+    """Build a plain chat completion response; the provider only reads attributes from it."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Test response"), finish_reason="stop")],
+        model=model,  # API returns the resolved model name
+        id="test-id",
+        created=1234567890,
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+    )
+
+
+@pytest.fixture
+def mock_openai_client():
+    """Patch the OpenAI client and return a fresh (mock_client, mock_response) pair."""
+    with patch("providers.openai_compatible.OpenAI") as mock_openai_class:
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+
+        mock_response = _fake_response()
+        mock_client.chat.completions.create.return_value = mock_response
+        yield mock_client, mock_response
+
+
+class TestXAIProvider:
+    """Test X.AI provider functionality."""
+
+    def test_initialization(self, xai_provider):
         """Test provider initialization."""
-        provider = XAIModelProvider("test-key")
-        assert provider.api_key == "test-key"
-        assert provider.get_provider_type() == ProviderType.XAI
-        assert provider.base_url == "https://api.x.ai/v1"
+        assert xai_provider.api_key == "test-key"
+        assert xai_provider.get_provider_type() == ProviderType.XAI
+        assert xai_provider.base_url == "https://api.x.ai/v1"
 
     def test_initialization_with_custom_url(self):
         """Test provider initialization with custom base URL."""
@@ -40,41 +80,69 @@ class TestXAIProvider:
         assert provider.api_key == "test-key"
         assert provider.base_url == "https://custom.x.ai/v1"
 
-    def test_model_validation(self):
+    @pytest.mark.parametrize(
+        "model_name, expected",
+        [
+            # Valid models
+            ("grok-4", True),
+            ("grok4", True),
+            ("grok", True),
+            ("grok-4.1-fast", True),
+            # Invalid models
+            ("invalid-model", False),
+            ("gpt-4", False),
+            ("gemini-pro", False),
+            ("grok-3", False),
+            ("grok-4.1-fast-reasoning", False),
+        ],
+    )
+    def test_model_validation(self, xai_provider, model_name, expected):
         """Test model name validation."""
-        provider = XAIModelProvider("test-key")
-
-        # Test valid models
-        assert provider.validate_model_name("grok-4") is True
-        assert provider.validate_model_name("grok4") is True
-        assert provider.validate_model_name("grok") is True
-        assert provider.validate_model_name("grok-4.1-fast") is True
+        assert xai_provider.validate_model_name(model_name) is expected
 
-        # Test invalid model
-        assert provider.validate_model_name("invalid-model") is False
-        assert provider.validate_model_name("gpt-4") is False
-        assert provider.validate_model_name("gemini-pro") is False
-        assert provider.validate_model_name("grok-3") is False
-        assert provider.validate_model_name("grok-4.1-fast-reasoning") is False
-
-    def test_resolve_model_name(self):
+    def test_resolve_model_name(self, xai_provider):
         """Test model name resolution."""
-        provider = XAIModelProvider("test-key")
-
         # Test shorthand resolution
-        assert provider._resolve_model_name("grok") == "grok-4-1-fast-non-reasoning"
-        assert provider._resolve_model_name("grok4") == "grok-4-1-fast-non-reasoning"
-        assert provider._resolve_model_name("grok41") == "grok-4-1-fast-non-reasoning"
+        assert xai_provider._resolve_model_name("grok") == "grok-4-1-fast-non-reasoning"
+        assert xai_provider._resolve_model_name("grok4") == "grok-4-1-fast-non-reasoning"
+        assert xai_provider._resolve_model_name("grok41") == "grok-4-1-fast-non-reasoning"
 
         # Test full name passthrough
-        assert provider._resolve_model_name("grok-4") == "grok-4-1-fast-non-reasoning"
-        assert provider._resolve_model_name("grok-4.1-fast") == "grok-4-1-fast-non-reasoning"
-
-    def test_get_capabilities_grok4(self):
+        assert xai_provider._resolve_model_name("grok-4") == "grok-4-1-fast-non-reasoning"
+        assert xai_provider._resolve_model_name("grok-4.1-fast") == "grok-4-1-fast-non-reasoning"
+
+    def test_alias_index(self, xai_provider):
+        """The alias index covers every alias and canonical name and is rebuilt on registry reload."""
+        for model_name, capabilities in xai_provider.MODEL_CAPABILITIES.items():
+            assert XAIModelProvider._alias_index[model_name.lower()] == model_name
+            for alias in capabilities.aliases:
+                assert XAIModelProvider._alias_index[alias.lower()] == model_name
+
+        assert xai_provider._resolve_model_name("GrokCode") == "grok-code-fast-1"
+        assert xai_provider._resolve_model_name("invalid-model") == "invalid-model"
+
+        previous_index = XAIModelProvider._alias_index
+        XAIModelProvider.reload_registry()
+        assert XAIModelProvider._alias_index is not previous_index
+        assert XAIModelProvider._alias_index == previous_index
+
+    def test_capabilities_memo(self, xai_provider, canonical_caps):
+        """Capability lookups are memoized per canonical name and reset on registry reload."""
+        capabilities = xai_provider.get_capabilities("grok")
+        assert capabilities == canonical_caps
+        assert XAIModelProvider._capabilities_cache["grok-4-1-fast-non-reasoning"] is capabilities
+        assert xai_provider.get_capabilities("grok-4") is capabilities
+
+        with pytest.raises(ValueError):
+            xai_provider.get_capabilities("invalid-model")
+        assert "invalid-model" not in XAIModelProvider._capabilities_cache
+
+        XAIModelProvider.reload_registry()
+        assert XAIModelProvider._capabilities_cache == {}
+
+    def test_get_capabilities_grok4(self, xai_provider):
         """Test getting model capabilities for GROK-4."""
-        provider = XAIModelProvider("test-key")
-
-        capabilities = provider.get_capabilities("grok-4")
+        capabilities = xai_provider.get_capabilities("grok-4")
         assert capabilities.model_name == "grok-4-1-fast-non-reasoning"
         assert capabilities.friendly_name == "X.AI (Grok 4.1 Fast Non-Reasoning)"
         assert capabilities.context_window == 2_000_000
@@ -91,11 +159,9 @@ class TestXAIProvider:
         assert capabilities.temperature_constraint.max_temp == 2.0
         assert capabilities.temperature_constraint.default_temp == 0.3
 
-    def test_get_capabilities_grok4_1_fast(self):
+    def test_get_capabilities_grok4_1_fast(self, xai_provider):
         """Test getting model capabilities for GROK-4.1 Fast Non-Reasoning."""
-        provider = XAIModelProvider("test-key")
-
-        capabilities = provider.get_capabilities("grok-4.1-fast")
+        capabilities = xai_provider.get_capabilities("grok-4.1-fast")
         assert capabilities.model_name == "grok-4-1-fast-non-reasoning"
         assert capabilities.friendly_name == "X.AI (Grok 4.1 Fast Non-Reasoning)"
         assert capabilities.context_window == 2_000_000
@@ -105,138 +171,110 @@ class TestXAIProvider:
         assert capabilities.supports_json_mode is True
         assert capabilities.supports_images is True
 
-    def test_get_capabilities_with_shorthand(self):
+    def test_get_capabilities_with_shorthand(self, xai_provider):
         """Test getting model capabilities with shorthand."""
-        provider = XAIModelProvider("test-key")
-
-        capabilities = provider.get_capabilities("grok")
+        capabilities = xai_provider.get_capabilities("grok")
         assert capabilities.model_name == "grok-4-1-fast-non-reasoning"  # Should resolve to full name
         assert capabilities.context_window == 2_000_000
 
-        capabilities_fast = provider.get_capabilities("grok-4.1-fast")
+        capabilities_fast = xai_provider.get_capabilities("grok-4.1-fast")
         assert capabilities_fast.model_name == "grok-4-1-fast-non-reasoning"  # Should resolve to full name
 
-    def test_unsupported_model_capabilities(self):
+    def test_unsupported_model_capabilities(self, xai_provider):
         """Test error handling for unsupported models."""
-        provider = XAIModelProvider("test-key")
-
         with pytest.raises(ValueError, match="Unsupported model 'invalid-model' for provider xai"):
-            provider.get_capabilities("invalid-model")
-
-    def test_extended_thinking_flags(self):
-        """X.AI capabilities should expose extended thinking support correctly."""
-        provider = XAIModelProvider("test-key")
+            xai_provider.get_capabilities("invalid-model")
 
-        # Note: The current Grok models do NOT support extended thinking
-        # The grok-4-1-fast-non-reasoning model has supports_extended_thinking = false
-        non_thinking_aliases = [
-            "grok-4",
+    @pytest.mark.parametrize(
+        "alias",
+        [
             "grok",
             "grok4",
+            "grok-4",
+            "grok41",
             "grok-4.1-fast",
-        ]
-        for alias in non_thinking_aliases:
-            assert provider.get_capabilities(alias).supports_extended_thinking is False
+            "grokfast",
+            "grok-4-1-fast-non-reasoning-latest",
+            "grok-4-1-fast-non-reasoning",
+        ],
+    )
+    def test_alias_resolves(self, xai_provider, canonical_caps, alias):
+        """Every Grok 4.1 Fast alias should share the canonical capabilities, without extended thinking."""
+        caps = xai_provider.get_capabilities(alias)
+        assert caps.model_name == canonical_caps.model_name
+        # The grok-4-1-fast-non-reasoning model has supports_extended_thinking = false
+        assert caps.supports_extended_thinking is False
 
-    def test_provider_type(self):
+    def test_provider_type(self, xai_provider):
         """Test provider type identification."""
-        provider = XAIModelProvider("test-key")
-        assert provider.get_provider_type() == ProviderType.XAI
-
-    @patch.dict(os.environ, {"XAI_ALLOWED_MODELS": "grok-4-1-fast-non-reasoning"})
-    def test_model_restrictions(self):
-        """Test model restrictions functionality."""
-        # Clear cached restriction service
-        import utils.model_restrictions
-        from providers.registry import ModelProviderRegistry
-
-        utils.model_restrictions._restriction_service = None
-        ModelProviderRegistry.reset_for_testing()
-
-        provider = XAIModelProvider("test-key")
-
-        # grok-4 alias should be allowed (resolves to grok-4-1-fast-non-reasoning)
-        assert provider.validate_model_name("grok-4") is True
-        assert provider.validate_model_name("grok") is True
-
-        # grok-code-fast-1 should be blocked by restrictions (different model)
-        assert provider.validate_model_name("grok-code-fast-1") is False
-        assert provider.validate_model_name("grok-code") is False
-
-    @patch.dict(os.environ, {"XAI_ALLOWED_MODELS": "grok-code-fast-1"})
-    def test_multiple_model_restrictions(self):
-        """Restrictions should allow aliases for Grok Code Fast."""
-        # Clear cached restriction service
-        import utils.model_restrictions
-        from providers.registry import ModelProviderRegistry
-
-        utils.model_restrictions._restriction_service = None
-        ModelProviderRegistry.reset_for_testing()
-
-        provider = XAIModelProvider("test-key")
-
-        # Aliases for grok-code-fast-1 should be allowed
-        assert provider.validate_model_name("grok-code") is True
-        assert provider.validate_model_name("grokcode") is True
-
-        # grok-4-1-fast-non-reasoning should NOT be allowed
-        assert provider.validate_model_name("grok-4") is False
-        assert provider.validate_model_name("grok") is False
-
-    @patch.dict(
-        os.environ, {"XAI_ALLOWED_MODELS": "grok,grok-4,grok-4.1-fast,grok-4-1-fast-non-reasoning,grok-code-fast-1"}
+        assert xai_provider.get_provider_type() == ProviderType.XAI
+
+    @pytest.mark.parametrize(
+        "restrict, allowed, blocked",
+        [
+            # grok-4 aliases resolve to the allowed canonical model; grok-code-fast-1 is a different model
+            ("grok-4-1-fast-non-reasoning", ["grok-4", "grok"], ["grok-code-fast-1", "grok-code"]),
+            # Restrictions should allow aliases for Grok Code Fast
+            ("grok-code-fast-1", ["grok-code", "grokcode"], ["grok-4", "grok"]),
+            # Aliases and canonical names can be allowed together
+            (
+                "grok,grok-4,grok-4.1-fast,grok-4-1-fast-non-reasoning,grok-code-fast-1",
+                ["grok", "grok-4", "grok-4.1-fast", "grok-4-1-fast-non-reasoning", "grok-code-fast-1"],
+                [],
+            ),
+            # Empty restrictions allow all models
+            ("", ["grok-4", "grok-4.1-fast", "grok", "grok4"], []),
+        ],
+        indirect=["restrict"],
+        ids=["canonical-only", "code-only", "aliases-and-canonical", "empty"],
     )
-    def test_both_shorthand_and_full_name_allowed(self):
-        """Test that aliases and canonical names can be allowed together."""
-        # Clear cached restriction service
-        import utils.model_restrictions
-
-        utils.model_restrictions._restriction_service = None
-
-        provider = XAIModelProvider("test-key")
-
-        # Both shorthand and full name should be allowed when explicitly listed
-        assert provider.validate_model_name("grok") is True  # Alias explicitly allowed
-        assert provider.validate_model_name("grok-4") is True  # Alias explicitly allowed
-        assert provider.validate_model_name("grok-4.1-fast") is True  # Alias explicitly allowed
-        assert provider.validate_model_name("grok-4-1-fast-non-reasoning") is True  # Canonical name explicitly allowed
-        assert provider.validate_model_name("grok-code-fast-1") is True  # Canonical name explicitly allowed
-
-    @patch.dict(os.environ, {"XAI_ALLOWED_MODELS": ""})
-    def test_empty_restrictions_allows_all(self):
-        """Test that empty restrictions allow all models."""
-        # Clear cached restriction service
-        import utils.model_restrictions
-
-        utils.model_restrictions._restriction_service = None
-
-        provider = XAIModelProvider("test-key")
-
-        assert provider.validate_model_name("grok-4") is True
-        assert provider.validate_model_name("grok-4.1-fast") is True
+    def test_model_restrictions(self, restrict, allowed, blocked):
+        """XAI_ALLOWED_MODELS should allow and block models by canonical name or alias."""
+        provider = XAIModelProvider("test-key", restriction_service=restrict)
+
+        for model_name in allowed:
+            assert provider.validate_model_name(model_name) is True, model_name
+        for model_name in blocked:
+            assert provider.validate_model_name(model_name) is False, model_name
+
+    @pytest.mark.parametrize("restrict", ["grok-code-fast-1"], indirect=True)
+    def test_injected_restriction_service(self, restrict):
+        """An injected restriction service is consulted instead of the global singleton."""
+        provider = XAIModelProvider("test-key", restriction_service=restrict)
+
+        with patch.object(model_restrictions, "get_restriction_service") as global_service:
+            assert provider.list_models(include_aliases=False) == ["grok-code-fast-1"]
+            assert provider.validate_model_name("grok-code") is True
+            global_service.assert_not_called()
+
+    def test_injected_service_overrides_env_allow_list(self, monkeypatch):
+        """An unrestricted injected service wins over a restrictive XAI_ALLOWED_MODELS."""
+        monkeypatch.delenv("XAI_ALLOWED_MODELS", raising=False)
+        unrestricted = model_restrictions.ModelRestrictionService()
+        monkeypatch.setenv("XAI_ALLOWED_MODELS", "grok-code-fast-1")
+
+        provider = XAIModelProvider("test-key", restriction_service=unrestricted)
+
+        assert provider.allowed_models is None
+        assert "grok-4-1-fast-non-reasoning" in provider.list_models(include_aliases=False)
         assert provider.validate_model_name("grok") is True
-        assert provider.validate_model_name("grok4") is True
+        assert provider.validate_model_name("grok-code") is True
 
-    def test_friendly_name(self):
+    def test_friendly_name(self, xai_provider):
         """Test friendly name constant."""
-        provider = XAIModelProvider("test-key")
-        assert provider.FRIENDLY_NAME == "X.AI"
+        assert xai_provider.FRIENDLY_NAME == "X.AI"
 
-        capabilities = provider.get_capabilities("grok-4")
+        capabilities = xai_provider.get_capabilities("grok-4")
         assert capabilities.friendly_name == "X.AI (Grok 4.1 Fast Non-Reasoning)"
 
-    def test_supported_models_structure(self):
+    def test_supported_models_structure(self, xai_provider):
         """Test that MODEL_CAPABILITIES has the correct structure."""
-        provider = XAIModelProvider("test-key")
-
         # Check that all expected base models are present
-        assert "grok-4-1-fast-non-reasoning" in provider.MODEL_CAPABILITIES
-        assert "grok-code-fast-1" in provider.MODEL_CAPABILITIES
+        assert "grok-4-1-fast-non-reasoning" in xai_provider.MODEL_CAPABILITIES
+        assert "grok-code-fast-1" in xai_provider.MODEL_CAPABILITIES
 
         # Check model configs have required fields
-        from providers.shared import ModelCapabilities
-
-        grok4_config = provider.MODEL_CAPABILITIES["grok-4-1-fast-non-reasoning"]
+        grok4_config = xai_provider.MODEL_CAPABILITIES["grok-4-1-fast-non-reasoning"]
         assert isinstance(grok4_config, ModelCapabilities)
         assert hasattr(grok4_config, "context_window")
         assert hasattr(grok4_config, "supports_extended_thinking")
@@ -254,31 +292,13 @@ class TestXAIProvider:
         assert grok4_config.model_name == "grok-4-1-fast-non-reasoning"
         assert "grok-4.1-fast" in grok4_config.aliases
 
-    @patch("providers.openai_compatible.OpenAI")
-    def test_generate_content_resolves_alias_before_api_call(self, mock_openai_class):
+    def test_generate_content_resolves_alias_before_api_call(self, mock_openai_client):
         """Test that generate_content resolves aliases before making API calls.
 
         This is the CRITICAL test that ensures aliases like 'grok' get resolved
         to 'grok-4' before being sent to X.AI API.
         """
-        # Set up mock OpenAI client
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-
-        # Mock the completion response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Test response"
-        mock_response.choices[0].finish_reason = "stop"
-        mock_response.model = "grok-4-1-fast-non-reasoning"  # API returns the resolved model name
-        mock_response.id = "test-id"
-        mock_response.created = 1234567890
-        mock_response.usage = MagicMock()
-        mock_response.usage.prompt_tokens = 10
-        mock_response.usage.completion_tokens = 5
-        mock_response.usage.total_tokens = 15
-
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client, _ = mock_openai_client
 
         provider = XAIModelProvider("test-key")
 
@@ -290,8 +310,9 @@ class TestXAIProvider:
         )
 
         # Verify the API was called with the RESOLVED model name
-        mock_client.chat.completions.create.assert_called_once()
-        call_kwargs = mock_client.chat.completions.create.call_args[1]
+        create = mock_client.chat.completions.create
+        create.assert_called_once()
+        call_kwargs = create.call_args.kwargs
 
         # CRITICAL ASSERTION: The API should receive "grok-4-1-fast-non-reasoning", not "grok"
         assert (
@@ -300,46 +321,28 @@ class TestXAIProvider:
 
         # Verify other parameters
         assert call_kwargs["temperature"] == 0.7
-        assert len(call_kwargs["messages"]) == 1
-        assert call_kwargs["messages"][0]["role"] == "user"
-        assert call_kwargs["messages"][0]["content"] == "Test prompt"
+        assert call_kwargs["messages"] == [{"role": "user", "content": "Test prompt"}]
 
         # Verify response
         assert result.content == "Test response"
         assert result.model_name == "grok-4-1-fast-non-reasoning"  # Should be the resolved name
 
-    @patch("providers.openai_compatible.OpenAI")
-    def test_generate_content_other_aliases(self, mock_openai_class):
+    @pytest.mark.parametrize(
+        "alias, expected_model",
+        [
+            ("grok4", "grok-4-1-fast-non-reasoning"),
+            ("grok-4", "grok-4-1-fast-non-reasoning"),
+            ("grok-4.1-fast", "grok-4-1-fast-non-reasoning"),
+            ("grokfast", "grok-4-1-fast-non-reasoning"),
+            ("grok-4-1-fast-non-reasoning", "grok-4-1-fast-non-reasoning"),
+            ("grokcode", "grok-code-fast-1"),
+        ],
+    )
+    def test_generate_content_other_aliases(self, mock_openai_client, alias, expected_model):
         """Test other alias resolutions in generate_content."""
-        from unittest.mock import MagicMock
-
-        # Set up mock
-        mock_client = MagicMock()
-        mock_openai_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Test response"
-        mock_response.choices[0].finish_reason = "stop"
-        mock_response.usage = MagicMock()
-        mock_response.usage.prompt_tokens = 10
-        mock_response.usage.completion_tokens = 5
-        mock_response.usage.total_tokens = 15
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client, _ = mock_openai_client
 
         provider = XAIModelProvider("test-key")
+        provider.generate_content(prompt="Test", model_name=alias, temperature=0.7)
 
-        # Test grok4 -> grok-4-1-fast-non-reasoning
-        mock_response.model = "grok-4-1-fast-non-reasoning"
-        provider.generate_content(prompt="Test", model_name="grok4", temperature=0.7)
-        call_kwargs = mock_client.chat.completions.create.call_args[1]
-        assert call_kwargs["model"] == "grok-4-1-fast-non-reasoning"
-
-        # Test grok-4 -> grok-4-1-fast-non-reasoning
-        provider.generate_content(prompt="Test", model_name="grok-4", temperature=0.7)
-        call_kwargs = mock_client.chat.completions.create.call_args[1]
-        assert call_kwargs["model"] == "grok-4-1-fast-non-reasoning"
-
-        # Test grok-4.1-fast -> grok-4-1-fast-non-reasoning
-        provider.generate_content(prompt="Test", model_name="grok-4.1-fast", temperature=0.7)
-        call_kwargs = mock_client.chat.completions.create.call_args[1]
-        assert call_kwargs["model"] == "grok-4-1-fast-non-reasoning"
+        assert mock_client.chat.completions.create.call_args.kwargs["model"] == expected_model